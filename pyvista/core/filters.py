@@ -47,6 +47,13 @@ def _update_alg(alg, progress_bar=False, message=''):
         alg.Update()
 
 
+def _resolve_normal(normal):
+    """Return the vector of a conventional direction such as ``'-x'``."""
+    if isinstance(normal, str):
+        return NORMALS[normal.lower()]
+    return normal
+
+
 def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
                 active_scalars_field='point'):
     """Get the algorithm's output and copy input's pyvista meta info."""
@@ -63,7 +70,8 @@ def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
 class DataSetFilters:
     """A set of common filters that can be applied to any vtkDataSet."""
 
-    def _clip_with_function(dataset, function, invert=True, value=0.0):
+    def _clip_with_function(dataset, function, invert=True, value=0.0,
+                            return_clipped=False):
         """Clip using an implicit function (internal helper)."""
         if isinstance(dataset, vtk.vtkPolyData):
             alg = vtk.vtkClipPolyData()
@@ -76,10 +84,35 @@ class DataSetFilters:
         alg.SetValue(value)
         alg.SetClipFunction(function) # the implicit function
         alg.SetInsideOut(invert) # invert the clip if needed
+        if return_clipped:
+            # the other side of the clip is generated in the same pass
+            alg.GenerateClippedOutputOn()
         alg.Update() # Perform the Cut
+        if return_clipped:
+            return _get_output(alg, oport=0), _get_output(alg, oport=1)
         return _get_output(alg)
 
-    def clip(dataset, normal='x', origin=None, invert=True, value=0.0, inplace=False):
+    def _crinkle_with_function(dataset, function, invert=True,
+                               return_clipped=False):
+        """Extract whole cells using an implicit function (internal helper)."""
+        def _extract(inside):
+            if isinstance(dataset, vtk.vtkPolyData):
+                alg = vtk.vtkExtractPolyDataGeometry()
+            else:
+                alg = vtk.vtkExtractGeometry()
+            alg.SetInputDataObject(dataset)
+            alg.SetImplicitFunction(function)
+            alg.SetExtractInside(inside)
+            alg.ExtractBoundaryCellsOn() # keep the cells cut by the function
+            alg.Update()
+            return _get_output(alg)
+        if return_clipped:
+            # the boundary cells are extracted on both sides
+            return _extract(invert), _extract(not invert)
+        return _extract(invert)
+
+    def clip(dataset, normal='x', origin=None, invert=True, value=0.0, inplace=False,
+             return_clipped=False, crinkle=False):
         """Clip a dataset by a plane by specifying the origin and normal.
 
         If no parameters are given the clip will occur in the center of that dataset.
@@ -104,20 +137,49 @@ class DataSetFilters:
             The default value is 0.0.
 
         inplace : bool, optional
-            Updates mesh in-place while returning nothing.
+            Updates mesh in-place while returning nothing.  If
+            ``return_clipped`` is also set, the mesh is overwritten with the
+            clipped part and only the remainder is returned.
+
+        return_clipped : bool, optional
+            Return both sides of the clip as a tuple ``(clipped, remainder)``
+            computed in a single pass. This is much faster than clipping the
+            dataset twice with opposite ``invert`` flags. With ``crinkle``
+            each side is extracted in its own pass.
+
+        crinkle : bool, optional
+            Crinkle the clip by extracting the entire cells along the clip
+            rather than cutting them. This skips the interpolation of the cut
+            cells and is much faster on large meshes. The cells along the
+            clip are kept on both sides, so with ``return_clipped`` they are
+            in both returned meshes.
 
         """
-        if isinstance(normal, str):
-            normal = NORMALS[normal.lower()]
+        normal = _resolve_normal(normal)
         # find center of data if origin not specified
         if origin is None:
             origin = dataset.center
-        # create the plane for clipping
-        function = generate_plane(normal, origin)
-        # run the clip
-        result = DataSetFilters._clip_with_function(dataset, function,
-                                                    invert=invert, value=value)
+        if crinkle:
+            # whole cells are extracted without a clip value: shift the
+            # plane along its normal instead
+            if value:
+                normal = np.asarray(normal, dtype=float)
+                origin = np.asarray(origin) + value * normal / np.linalg.norm(normal)
+            function = generate_plane(normal, origin)
+            result = DataSetFilters._crinkle_with_function(dataset, function,
+                                                           invert=invert,
+                                                           return_clipped=return_clipped)
+        else:
+            # create the plane for clipping
+            function = generate_plane(normal, origin)
+            # run the clip
+            result = DataSetFilters._clip_with_function(dataset, function,
+                                                        invert=invert, value=value,
+                                                        return_clipped=return_clipped)
         if inplace:
+            if return_clipped:
+                dataset.overwrite(result[0])
+                return result[1]
             dataset.overwrite(result)
         else:
             return result
@@ -258,6 +320,43 @@ class DataSetFilters:
                                                     invert=invert, value=value)
         return result
 
+    def _slice_with_planes(dataset, normals, origins, generate_triangles=False):
+        """Slice by each normal and origin reusing one cutter and plane (internal helper)."""
+        volume = (isinstance(dataset, vtk.vtkImageData) and
+                  min(dataset.GetDimensions()) > 1)
+        scalars = dataset.GetPointData().GetArray(0) if volume else None
+        if (generate_triangles and scalars is not None and scalars.GetName() and
+                scalars.GetDataType() != vtk.VTK_BIT and
+                dataset.GetCellData().GetNumberOfArrays() == 0):
+            # Flying edges is much faster on volumes but only generates
+            # triangles, needs a point array and does not pass on cell data.
+            # Where the plane passes through grid points it makes more
+            # zero-area triangles than vtkCutter: the surface is the same
+            # but the triangle count is not
+            alg = vtk.vtkFlyingEdgesPlaneCutter()
+            alg.SetInputArrayToProcess(0, 0, 0, FieldAssociation.POINT.value,
+                                       scalars.GetName())
+            alg.InterpolateAttributesOn()
+            set_plane = alg.SetPlane
+        else:
+            alg = vtk.vtkCutter() # Construct the cutter object
+            if not generate_triangles:
+                alg.GenerateTrianglesOff()
+            set_plane = alg.SetCutFunction
+        alg.SetInputDataObject(dataset) # Use the grid as the data we desire to cut
+        # the plane is updated in place for each slice
+        plane = vtk.vtkPlane()
+        set_plane(plane) # the cutter to use the plane we made
+        slices = []
+        for normal, origin in zip(normals, origins):
+            # NORMAL MUST HAVE MAGNITUDE OF 1
+            plane.SetNormal(normal / np.linalg.norm(normal))
+            plane.SetOrigin(origin)
+            alg.Update() # Perform the Cut
+            # the cutter reuses its output object on the next update
+            slices.append(_get_output(alg).copy(deep=False))
+        return slices
+
     def slice(dataset, normal='x', origin=None, generate_triangles=False,
               contour=False):
         """Slice a dataset by a plane at the specified origin and normal vector orientation.
@@ -277,26 +376,20 @@ class DataSetFilters:
         generate_triangles: bool, optional
             If this is enabled (``False`` by default), the output will be
             triangles otherwise, the output will be the intersection polygons.
+            For image data without cell arrays, planes passing through grid
+            points can produce extra zero-area triangles.
 
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
         """
-        if isinstance(normal, str):
-            normal = NORMALS[normal.lower()]
+        normal = _resolve_normal(normal)
         # find center of data if origin not specified
         if origin is None:
             origin = dataset.center
-        # create the plane for clipping
-        plane = generate_plane(normal, origin)
         # create slice
-        alg = vtk.vtkCutter() # Construct the cutter object
-        alg.SetInputDataObject(dataset) # Use the grid as the data we desire to cut
-        alg.SetCutFunction(plane) # the cutter to use the plane we made
-        if not generate_triangles:
-            alg.GenerateTrianglesOff()
-        alg.Update() # Perform the Cut
-        output = _get_output(alg)
+        output, = DataSetFilters._slice_with_planes(dataset, [normal], [origin],
+                                                    generate_triangles=generate_triangles)
         if contour:
             return output.contour()
         return output
@@ -321,18 +414,22 @@ class DataSetFilters:
         generate_triangles: bool, optional
             If this is enabled (``False`` by default), the output will be
             triangles otherwise, the output will be the intersection polygons.
+            For image data without cell arrays, planes passing through grid
+            points can produce extra zero-area triangles.
 
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
         """
         # Create the three slices
-        if x is None:
-            x = dataset.center[0]
-        if y is None:
-            y = dataset.center[1]
-        if z is None:
-            z = dataset.center[2]
+        if x is None or y is None or z is None:
+            center = dataset.center
+            if x is None:
+                x = center[0]
+            if y is None:
+                y = center[1]
+            if z is None:
+                z = center[2]
         output = pyvista.MultiBlock()
         if isinstance(dataset, pyvista.MultiBlock):
             for i in range(dataset.n_blocks):
@@ -340,14 +437,18 @@ class DataSetFilters:
                     generate_triangles=generate_triangles,
                     contour=contour)
             return output
-        output[0, 'YZ'] = dataset.slice(normal='x', origin=[x,y,z], generate_triangles=generate_triangles)
-        output[1, 'XZ'] = dataset.slice(normal='y', origin=[x,y,z], generate_triangles=generate_triangles)
-        output[2, 'XY'] = dataset.slice(normal='z', origin=[x,y,z], generate_triangles=generate_triangles)
+        normals = [NORMALS[axis] for axis in 'xyz']
+        origins = [[x, y, z]] * 3
+        yz, xz, xy = DataSetFilters._slice_with_planes(dataset, normals, origins,
+                                                       generate_triangles=generate_triangles)
+        output[0, 'YZ'] = yz
+        output[1, 'XZ'] = xz
+        output[2, 'XY'] = xy
         return output
 
     def slice_along_axis(dataset, n=5, axis='x', tolerance=None,
                          generate_triangles=False, contour=False,
-                         bounds=None, center=None):
+                         bounds=None, center=None, combined=False):
         """Create many slices of the input dataset along a specified axis.
 
         Parameters
@@ -366,10 +467,18 @@ class DataSetFilters:
         generate_triangles: bool, optional
             If this is enabled (``False`` by default), the output will be
             triangles otherwise, the output will be the intersection polygons.
+            For image data without cell arrays, planes passing through grid
+            points can produce extra zero-area triangles.
 
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        combined : bool, optional
+            If True, cut all of the slices in a single pass and return them
+            together as one :class:`pyvista.PolyData` instead of a
+            :class:`pyvista.MultiBlock` with one block per slice. Note that
+            VTK always triangulates slices of image data in this mode.
+
         """
         axes = {'x':0, 'y':1, 'z':2}
         if isinstance(axis, int):
@@ -388,20 +497,41 @@ class DataSetFilters:
         if tolerance is None:
             tolerance = (bounds[ax*2+1] - bounds[ax*2]) * 0.01
         rng = np.linspace(bounds[ax*2]+tolerance, bounds[ax*2+1]-tolerance, n)
-        center = list(center)
         # Make each of the slices
         output = pyvista.MultiBlock()
         if isinstance(dataset, pyvista.MultiBlock):
             for i in range(dataset.n_blocks):
                 output[i] = dataset[i].slice_along_axis(n=n, axis=axis,
                     tolerance=tolerance, generate_triangles=generate_triangles,
-                    contour=contour, bounds=bounds, center=center)
+                    contour=contour, bounds=bounds, center=center,
+                    combined=combined)
             return output
-        for i in range(n):
-            center[ax] = rng[i]
-            slc = DataSetFilters.slice(dataset, normal=axis, origin=center,
-                                       generate_triangles=generate_triangles,
-                                       contour=contour)
+        if combined:
+            # Cut every slice at once as offsets from a plane through the center
+            plane = vtk.vtkPlane()
+            plane.SetNormal(NORMALS[axis])
+            plane.SetOrigin(center)
+            alg = vtk.vtkCutter()
+            alg.SetInputDataObject(dataset)
+            alg.SetCutFunction(plane)
+            if not generate_triangles:
+                alg.GenerateTrianglesOff()
+            alg.SetNumberOfContours(n)
+            for i, value in enumerate(rng):
+                alg.SetValue(i, value - center[ax])
+            alg.Update()
+            output = _get_output(alg)
+            if contour:
+                return output.contour()
+            return output
+        normals = [NORMALS[axis]] * n
+        origins = np.tile(np.asarray(center, dtype=float), (n, 1))
+        origins[:, ax] = rng
+        slices = DataSetFilters._slice_with_planes(dataset, normals, origins,
+                                                   generate_triangles=generate_triangles)
+        for i, slc in enumerate(slices):
+            if contour:
+                slc = slc.contour()
             output[i, 'slice%.2d' % i] = slc
         return output
 
@@ -503,14 +633,33 @@ class DataSetFilters:
         if arr is None:
             raise ValueError('No arrays present to threshold.')
 
-        # If using an inverted range, merge the result of two filters:
-        if isinstance(value, collections.Iterable) and invert:
-            valid_range = [np.nanmin(arr), np.nanmax(arr)]
-            # Create two thresholds
-            t1 = dataset.threshold([valid_range[0], value[0]], scalars=scalars,
-                    continuous=continuous, preference=preference, invert=False)
-            t2 = dataset.threshold([value[1], valid_range[1]], scalars=scalars,
-                    continuous=continuous, preference=preference, invert=False)
+        return DataSetFilters._threshold_core(dataset, value, arr, field, scalars,
+                                              invert=invert, continuous=continuous,
+                                              all_scalars=all_scalars)
+
+    def _threshold_core(dataset, value, arr, field, scalars, invert=False,
+                        continuous=False, all_scalars=True):
+        """Threshold on an array that has already been found (internal helper)."""
+        # An inverted range can be thresholded in a single pass when each
+        # cell has a single value and ``vtkThreshold.SetInvert`` (VTK 9.1+)
+        # is available. NaN is never within the range, so inverting would
+        # keep those cells: only use it when the array holds no NaNs
+        invert_range = (isinstance(value, collections.Iterable) and invert)
+        single_pass = (invert_range and field == FieldAssociation.CELL and
+                       hasattr(vtk.vtkThreshold, 'SetInvert') and
+                       (not np.issubdtype(arr.dtype, np.inexact) or
+                        not np.isnan(arr).any()))
+
+        # Otherwise if using an inverted range, merge the result of two filters:
+        if invert_range and not single_pass:
+            # Create two thresholds: below and above the range. These are
+            # open ended, so the data range never needs to be scanned.
+            # ``all_scalars`` is not forwarded: without it, a cell with
+            # points on both sides would be in both results
+            t1 = DataSetFilters._threshold_core(dataset, [-np.inf, value[0]],
+                    arr, field, scalars, continuous=continuous)
+            t2 = DataSetFilters._threshold_core(dataset, [value[1], np.inf],
+                    arr, field, scalars, continuous=continuous)
             # Use an AppendFilter to merge the two results
             appender = vtk.vtkAppendFilter()
             appender.AddInputData(t1)
@@ -527,12 +676,19 @@ class DataSetFilters:
         alg.SetUseContinuousCellRange(continuous)
         # use valid range if no value given
         if value is None:
-            value = dataset.get_data_range(scalars)
+            # reuse the array found above rather than searching for it again
+            value = dataset.get_data_range(arr)
         # check if value is iterable (if so threshold by min max range like ParaView)
         if isinstance(value, collections.Iterable):
             if len(value) != 2:
                 raise ValueError('Value range must be length one for a float value or two for min/max; not ({}).'.format(value))
-            alg.ThresholdBetween(value[0], value[1])
+            if invert_range:
+                # keep the values outside of the range including its bounds
+                alg.ThresholdBetween(np.nextafter(value[0], np.inf),
+                                     np.nextafter(value[1], -np.inf))
+                alg.SetInvert(True)
+            else:
+                alg.ThresholdBetween(value[0], value[1])
         else:
             # just a single value
             if invert:
@@ -576,7 +732,10 @@ class DataSetFilters:
             _, tscalars = dataset.active_scalars_info
         else:
             tscalars = scalars
-        dmin, dmax = dataset.get_data_range(arr=tscalars, preference=preference)
+        arr, field = get_array(dataset, tscalars, preference=preference, info=True)
+        if arr is None:
+            raise ValueError('No arrays present to threshold.')
+        dmin, dmax = dataset.get_data_range(arr)
 
         def _check_percent(percent):
             """Make sure percent is between 0 and 1 or fix if between 0 and 100."""
@@ -600,10 +759,74 @@ class DataSetFilters:
         else:
             # Compute one value to threshold
             value = _get_val(percent, dmin, dmax)
-        # Use the normal thresholding function on these values
-        return DataSetFilters.threshold(dataset, value=value, scalars=scalars,
-                                        invert=invert, continuous=continuous,
-                                        preference=preference)
+        # Threshold the array found above on these values
+        return DataSetFilters._threshold_core(dataset, value, arr, field, tscalars,
+                                              invert=invert, continuous=continuous)
+
+    def threshold_then_slice(dataset, value=None, scalars=None, invert=False,
+                             normal='x', origin=None, generate_triangles=False,
+                             preference='cell'):
+        """Threshold the dataset then slice the thresholded cells by a plane.
+
+        This produces the same surface as ``dataset.threshold(...).slice(...)``.
+        When thresholding on cell data, the dataset is sliced first and only
+        the slice is thresholded, so the full size thresholded mesh is never
+        created.
+
+        Parameters
+        ----------
+        value : float or iterable, optional
+            Single value or (min, max) to be used for the data threshold. See
+            :func:`DataSetFilters.threshold`.
+
+        scalars : str, optional
+            Name of scalars to threshold on. Defaults to currently active scalars.
+
+        invert : bool, optional
+            Invert the threshold. See :func:`DataSetFilters.threshold`.
+
+        normal : tuple(float) or str
+            Length 3 tuple for the normal vector direction of the slice. Can
+            also be specified as a string conventional direction such as
+            ``'x'`` for ``(1,0,0)`` or ``'-x'`` for ``(-1,0,0)``, etc.
+
+        origin : tuple(float)
+            The center (x,y,z) coordinate of the plane on which the slice
+            occurs. Defaults to the center of the input dataset.
+
+        generate_triangles: bool, optional
+            If this is enabled (``False`` by default), the output will be
+            triangles otherwise, the output will be the intersection polygons.
+            For image data without cell arrays, planes passing through grid
+            points can produce extra zero-area triangles.
+
+        preference : str, optional
+            When scalars is specified, this is the preferred array type to
+            search for in the dataset.  Must be either ``'point'`` or ``'cell'``
+
+        """
+        if scalars is None:
+            field, scalars = dataset.active_scalars_info
+        arr, field = get_array(dataset, scalars, preference=preference, info=True)
+        if arr is None:
+            raise ValueError('No arrays present to threshold.')
+        if origin is None:
+            origin = dataset.center
+        if field != FieldAssociation.CELL:
+            # point data thresholds depend on all the points of each cell
+            thresh = DataSetFilters._threshold_core(dataset, value, arr, field,
+                                                    scalars, invert=invert)
+            return DataSetFilters.slice(thresh, normal=normal, origin=origin,
+                                        generate_triangles=generate_triangles)
+        # the slice keeps the cell data of the cells it cuts, so only the
+        # slice needs to be thresholded
+        slc = DataSetFilters.slice(dataset, normal=normal, origin=origin,
+                                   generate_triangles=generate_triangles)
+        if value is None:
+            value = dataset.get_data_range(arr)
+        thresh = DataSetFilters.threshold(slc, value=value, scalars=scalars,
+                                          invert=invert, preference='cell')
+        return DataSetFilters.extract_geometry(thresh)
 
     def outline(dataset, generate_faces=False):
         """Produce an outline of the full extent for the input dataset.
@@ -721,12 +944,15 @@ class DataSetFilters:
 
         """
         # Fix the projection line:
+        if low_point is None or high_point is None:
+            center = dataset.center
+            bounds = dataset.bounds
         if low_point is None:
-            low_point = list(dataset.center)
-            low_point[2] = dataset.bounds[4]
+            low_point = list(center)
+            low_point[2] = bounds[4]
         if high_point is None:
-            high_point = list(dataset.center)
-            high_point[2] = dataset.bounds[5]
+            high_point = list(center)
+            high_point[2] = bounds[5]
         # Fix scalar_range:
         if scalar_range is None:
             scalar_range = (low_point[2], high_point[2])
@@ -788,7 +1014,11 @@ class DataSetFilters:
         method : str, optional
             Specify to choose which vtk filter is used to create the contour.
             Must be one of ``'contour'``, ``'marching_cubes'`` and
-            ``'flying_edges'``. Defaults to ``'contour'``.
+            ``'flying_edges'``. Defaults to ``'contour'``. On image data
+            ``'flying_edges'`` is considerably faster, but it does not pass
+            the other arrays through and where an isosurface passes through
+            grid points it makes extra degenerate triangles and unmerged
+            points.
 
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
@@ -822,7 +1052,8 @@ class DataSetFilters:
         if isinstance(isosurfaces, int):
             # generate values
             if rng is None:
-                rng = dataset.get_data_range(scalars)
+                # use the range of the point array found above
+                rng = dataset.get_data_range(scalars, preference=field)
             alg.GenerateValues(isosurfaces, rng)
         elif isinstance(isosurfaces, collections.Iterable):
             alg.SetNumberOfContours(len(isosurfaces))
@@ -889,11 +1120,13 @@ class DataSetFilters:
             return output
         t_coords = output.GetPointData().GetTCoords()
         t_coords.SetName(name)
-        otc = dataset.GetPointData().GetTCoords()
-        dataset.GetPointData().SetTCoords(t_coords)
-        dataset.GetPointData().AddArray(t_coords)
-        # CRITICAL:
-        dataset.GetPointData().AddArray(otc) # Add old ones back at the end
+        pdata = dataset.GetPointData()
+        otc = pdata.GetTCoords()
+        # this also adds the array to the point data
+        pdata.SetTCoords(t_coords)
+        # CRITICAL: Add old ones back at the end unless they were replaced
+        if otc is not None and otc.GetName() != name:
+            pdata.AddArray(otc)
         return # No return type because it is inplace
 
     def compute_cell_sizes(dataset, length=True, area=True, volume=True,
@@ -20,12 +20,12 @@ import pyvista
 from pyvista.utilities import assert_empty_kwargs, check_valid_vector
 
 NORMALS = {
-    'x': [1, 0, 0],
-    'y': [0, 1, 0],
-    'z': [0, 0, 1],
-    '-x': [-1, 0, 0],
-    '-y': [0, -1, 0],
-    '-z': [0, 0, -1],
+    'x': (1, 0, 0),
+    'y': (0, 1, 0),
+    'z': (0, 0, 1),
+    '-x': (-1, 0, 0),
+    '-y': (0, -1, 0),
+    '-z': (0, 0, -1),
 }
 
 
@@ -237,31 +237,24 @@ def get_array(mesh, name, preference='cell', info=False, err=False):
             return arr, field
         return arr
 
-    parr = point_array(mesh, name)
-    carr = cell_array(mesh, name)
-    farr = field_array(mesh, name)
+    # find the VTK arrays first and only convert the one that is returned
+    parr = mesh.GetPointData().GetAbstractArray(name)
+    carr = mesh.GetCellData().GetAbstractArray(name)
+    farr = mesh.GetFieldData().GetAbstractArray(name)
     preference = parse_field_choice(preference)
     if np.sum([parr is not None, carr is not None, farr is not None]) > 1:
         if preference == FieldAssociation.CELL:
-            if info:
-                return carr, FieldAssociation.CELL
-            else:
-                return carr
+            arr = carr
+            field = FieldAssociation.CELL
         elif preference == FieldAssociation.POINT:
-            if info:
-                return parr, FieldAssociation.POINT
-            else:
-                return parr
+            arr = parr
+            field = FieldAssociation.POINT
         elif preference == FieldAssociation.NONE:
-            if info:
-                return farr, FieldAssociation.NONE
-            else:
-                return farr
+            arr = farr
+            field = FieldAssociation.NONE
         else:
             raise ValueError('Data field ({}) not supported.'.format(preference))
-    arr = None
-    field = None
-    if parr is not None:
+    elif parr is not None:
         arr = parr
         field = FieldAssociation.POINT
     elif carr is not None:
@@ -272,6 +265,10 @@ def get_array(mesh, name, preference='cell', info=False, err=False):
         field = FieldAssociation.NONE
     elif err:
         raise KeyError('Data array ({}) not present in this dataset.'.format(name))
+    else:
+        arr = None
+        field = None
+    arr = convert_array(arr)
     if info:
         return arr, field
     return arr
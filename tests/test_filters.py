@@ -2,6 +2,7 @@ import sys
 
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples
@@ -52,11 +53,42 @@ def test_clip_filter():
             assert isinstance(clp, pyvista.UnstructuredGrid)
 
 
+def test_clip_filter_return_clipped():
+    for i, dataset in enumerate(DATASETS):
+        clp, rem = dataset.clip(normal=normals[i], return_clipped=True)
+        assert isinstance(clp, type(dataset.clip(normal=normals[i])))
+        assert clp.n_cells == dataset.clip(normal=normals[i]).n_cells
+        assert rem.n_cells == dataset.clip(normal=normals[i], invert=False).n_cells
+    dataset = examples.load_airplane()
+    n_cells = dataset.clip().n_cells
+    rem = dataset.clip(return_clipped=True, inplace=True)
+    assert dataset.n_cells == n_cells
+    assert isinstance(rem, pyvista.PolyData)
+
+
+def test_clip_filter_crinkle():
+    for i, dataset in enumerate(DATASETS):
+        clp = dataset.clip(normal=normals[i], crinkle=True)
+        assert isinstance(clp, type(dataset.clip(normal=normals[i])))
+        assert 0 < clp.n_cells <= dataset.n_cells
+    dataset = examples.load_hexbeam()
+    clp, rem = dataset.clip('x', crinkle=True, return_clipped=True)
+    assert clp.n_cells and rem.n_cells
+    # the cells along the clip are on both sides
+    assert clp.n_cells + rem.n_cells >= dataset.n_cells
+    # shifting the plane past the dataset keeps everything on one side
+    clp = dataset.clip('x', value=-10.0, crinkle=True)
+    assert clp.n_cells == 0
+
+
 @skip_py2_nobind
 def test_clip_filter_composite():
     # Now test composite data structures
     output = COMPOSITE.clip(normal=normals[0], invert=False)
     assert output.n_blocks == COMPOSITE.n_blocks
+    clp, rem = COMPOSITE.clip(normal=normals[0], return_clipped=True)
+    assert clp.n_blocks == COMPOSITE.n_blocks
+    assert rem.n_blocks == COMPOSITE.n_blocks
 
 
 def test_clip_box():
@@ -133,6 +165,40 @@ def test_slice_filter():
     assert result.n_points < 1
 
 
+def test_slice_filter_triangles_volume():
+    grid = pyvista.UniformGrid((20, 30, 10), (0.5, 1, 2), (3, -4, 5))
+    grid.point_arrays['scalars'] = np.arange(grid.n_points, dtype=float)
+    grid.point_arrays['vectors'] = grid.points
+    # the last plane passes through grid points
+    for normal, origin in [('x', None), ('z', None), ((1, 1, 1), None),
+                           ((1, 2, 3), grid.points[grid.n_points // 2])]:
+        slc = grid.slice(normal=normal, origin=origin, generate_triangles=True)
+        assert isinstance(slc, pyvista.PolyData)
+        assert slc.is_all_triangles()
+        assert 'scalars' in slc.point_arrays
+        assert np.allclose(slc['vectors'], slc.points)
+        # same geometry as a triangulated slice with cell data present
+        grid.cell_arrays['cells'] = np.arange(grid.n_cells)
+        expected = grid.slice(normal=normal, origin=origin,
+                              generate_triangles=True)
+        grid.cell_arrays.remove('cells')
+        assert 'cells' in expected.cell_arrays
+        # degenerate triangles may differ, so compare the merged points
+        assert slc.clean().n_points == expected.clean().n_points
+        assert np.isclose(slc.area, expected.area)
+    # bit arrays cannot be cut by flying edges
+    grid = pyvista.UniformGrid((10, 10, 10))
+    bits = vtk.vtkBitArray()
+    bits.SetName('bits')
+    bits.SetNumberOfTuples(grid.n_points)
+    for i in range(grid.n_points):
+        bits.SetValue(i, i % 2)
+    grid.GetPointData().AddArray(bits)
+    slc = grid.slice(generate_triangles=True)
+    assert slc.n_cells
+    assert np.isclose(slc.area, 81)
+
+
 @skip_py2_nobind
 def test_slice_filter_composite():
     # Now test composite data structures
@@ -150,6 +216,11 @@ def test_slice_orthogonal_filter():
         assert slices.n_blocks == 3
         for slc in slices:
             assert isinstance(slc, pyvista.PolyData)
+        # each slice must match the single slice filter
+        for slc, normal in zip(slices, 'xyz'):
+            expected = dataset.slice(normal=normal)
+            assert slc.n_points == expected.n_points
+            assert np.allclose(slc.bounds, expected.bounds)
 
 
 @skip_py2_nobind
@@ -173,6 +244,24 @@ def test_slice_along_axis():
     dataset = examples.load_uniform()
     with pytest.raises(ValueError):
         dataset.slice_along_axis(axis='u')
+    # each slice must match the single slice filter
+    slices = dataset.slice_along_axis(n=3, axis='z', tolerance=0.0)
+    bounds = dataset.bounds
+    for slc, z in zip(slices, [bounds[4], np.mean(bounds[4:]), bounds[5]]):
+        origin = dataset.center[:2] + [z]
+        expected = dataset.slice(normal='z', origin=origin)
+        assert slc.n_points == expected.n_points
+        assert np.allclose(slc.bounds, expected.bounds)
+    # all slices at once must match the individual slices
+    for i, dataset in enumerate(DATASETS):
+        slices = dataset.slice_along_axis(n=ns[i], axis=axii[i])
+        combined = dataset.slice_along_axis(n=ns[i], axis=axii[i], combined=True)
+        assert isinstance(combined, pyvista.PolyData)
+        assert combined.n_points == sum(slc.n_points for slc in slices)
+        assert np.isclose(combined.triangulate().area,
+                          sum(slc.triangulate().area for slc in slices))
+        if not isinstance(dataset, pyvista.UniformGrid):
+            assert combined.n_cells == sum(slc.n_cells for slc in slices)
 
 
 @skip_py2_nobind
@@ -180,6 +269,10 @@ def test_slice_along_axis_composite():
     # Now test composite data structures
     output = COMPOSITE.slice_along_axis()
     assert output.n_blocks == COMPOSITE.n_blocks
+    output = COMPOSITE.slice_along_axis(combined=True)
+    assert output.n_blocks == COMPOSITE.n_blocks
+    for block in output:
+        assert isinstance(block, pyvista.PolyData)
 
 
 def test_threshold():
@@ -198,6 +291,26 @@ def test_threshold():
     thresh = dataset.threshold([100, 500], invert=True)
     assert thresh is not None
     assert isinstance(thresh, pyvista.UnstructuredGrid)
+    for scalars in ['Spatial Cell Data', 'Spatial Point Data']:
+        dmin, dmax = dataset.get_data_range(scalars)
+        thresh = dataset.threshold([100, 500], scalars=scalars, invert=True)
+        lower = dataset.threshold([dmin, 100], scalars=scalars)
+        upper = dataset.threshold([500, dmax], scalars=scalars)
+        assert thresh.n_cells == lower.n_cells + upper.n_cells
+    # NaN values are never kept by an inverted range
+    grid = pyvista.UniformGrid((6, 6, 6))
+    grid.cell_arrays['c'] = np.arange(grid.n_cells, dtype=float)
+    grid.cell_arrays['c'][::12] = np.nan
+    thresh = grid.threshold([20, 40], scalars='c', invert=True)
+    assert not np.isnan(thresh.cell_arrays['c']).any()
+    assert thresh.n_cells == grid.threshold([0, 20], scalars='c').n_cells + \
+        grid.threshold([40, grid.n_cells], scalars='c').n_cells
+    # cells with points on both sides of the range are only kept once
+    grid = pyvista.UniformGrid((10, 10, 10))
+    grid.point_arrays['p'] = np.random.random(grid.n_points)
+    thresh = grid.threshold([0.3, 0.7], scalars='p', invert=True,
+                            all_scalars=False)
+    assert thresh.n_cells <= grid.n_cells
     # Now test DATASETS without arrays
     with pytest.raises(ValueError):
         for i, dataset in enumerate(DATASETS[3:-1]):
@@ -207,6 +320,11 @@ def test_threshold():
     dataset = examples.load_uniform()
     with pytest.raises(ValueError):
         dataset.threshold([10, 100, 300])
+    # the default range must come from the preferred array
+    dataset.point_arrays['data'] = np.arange(dataset.n_points)
+    dataset.cell_arrays['data'] = np.arange(dataset.n_cells) + dataset.n_points
+    thresh = dataset.threshold(scalars='data', preference='point')
+    assert thresh.n_cells == dataset.n_cells
 
 
 def test_threshold_percent():
@@ -223,6 +341,30 @@ def test_threshold_percent():
         result = dataset.threshold_percent(20000)
     with pytest.raises(ValueError):
         result = dataset.threshold_percent(0.0)
+    with pytest.raises(ValueError):
+        examples.load_airplane().threshold_percent()
+
+
+def test_threshold_then_slice():
+    dataset = examples.load_uniform()
+    for normal in ['x', (1, 1, 1)]:
+        for invert in [False, True]:
+            expected = dataset.threshold([200, 600], invert=invert,
+                                         scalars='Spatial Cell Data')
+            expected = expected.slice(normal=normal, origin=dataset.center)
+            slc = dataset.threshold_then_slice([200, 600], invert=invert,
+                                               scalars='Spatial Cell Data',
+                                               normal=normal)
+            assert isinstance(slc, pyvista.PolyData)
+            assert slc.n_cells == expected.n_cells
+            assert np.allclose(slc.bounds, expected.bounds)
+    expected = dataset.threshold(100, scalars='Spatial Point Data')
+    expected = expected.slice(origin=dataset.center)
+    slc = dataset.threshold_then_slice(100, scalars='Spatial Point Data')
+    assert isinstance(slc, pyvista.PolyData)
+    assert slc.n_cells == expected.n_cells > 0
+    with pytest.raises(ValueError):
+        examples.load_airplane().threshold_then_slice()
 
 
 def test_outline():
@@ -300,6 +442,14 @@ def test_contour(uniform, method):
     assert iso is not None
 
 
+def test_contour_range_preference(uniform):
+    uniform = uniform.copy()
+    uniform.point_arrays['data'] = np.arange(uniform.n_points)
+    uniform.cell_arrays['data'] = np.arange(uniform.n_cells) + uniform.n_points
+    iso = uniform.contour(isosurfaces=5, scalars='data')
+    assert iso.n_points
+
+
 def test_contour_errors(uniform):
     with pytest.raises(TypeError):
         uniform.contour(scalars='Spatial Cell Data')
@@ -371,6 +521,15 @@ def test_texture_map_to_plane():
     # FINAL: Test in place modifiacation
     dataset.texture_map_to_plane(inplace=True)
     assert 'Texture Coordinates' in dataset.array_names
+    # the old coordinates are kept under their own name
+    dataset.texture_map_to_plane(inplace=True, name='other')
+    assert dataset.GetPointData().GetTCoords().GetName() == 'other'
+    assert 'Texture Coordinates' in dataset.array_names
+    # reusing a name replaces the coordinates
+    dataset.texture_map_to_plane(origin=origin, point_u=point_u,
+                                 point_v=point_v, inplace=True, name='other')
+    assert np.allclose(dataset['other'], out['Texture Coordinates'])
+    assert dataset.GetPointData().GetNumberOfArrays() == 2
 
 
 def test_compute_cell_sizes():